@@ -5,19 +5,112 @@ This module handles loading environment variables and providing
 configuration values to the application.
 """
 
+import functools
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
 from dotenv import load_dotenv
 
 # Load environment variables from .env file if it exists
 load_dotenv()
 
+# Include response headers and request bodies in tool results for debugging
+DEBUG_RESPONSES = os.getenv("HYPERFUNNEL_DEBUG") == "1"
+
+# Shared HTTP client, created lazily by get_http_client()
+_http_client: Optional[httpx.AsyncClient] = None
+# Number of active MCP sessions using the shared HTTP client
+_http_client_users = 0
 
+
+@functools.cache
 def get_api_base_url() -> str:
     """
     Get the HyperFunnel API base URL from environment variables.
 
+    The value is read once per process and cached.
+
     Returns:
         str: The base URL for the HyperFunnel API. Defaults to http://127.0.0.1:8000
              if HYPERFUNNEL_API_BASE_URL is not set in environment.
     """
     return os.getenv("HYPERFUNNEL_API_BASE_URL", "http://127.0.0.1:8000")
+
+
+def get_http_limits() -> httpx.Limits:
+    """
+    Get the connection pool limits for the shared HTTP client.
+
+    Returns:
+        httpx.Limits: Pool limits read from HYPERFUNNEL_HTTP_MAX_CONNECTIONS
+             (default 100) and HYPERFUNNEL_HTTP_MAX_KEEPALIVE (default 20).
+    """
+    return httpx.Limits(
+        max_connections=int(os.getenv("HYPERFUNNEL_HTTP_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(
+            os.getenv("HYPERFUNNEL_HTTP_MAX_KEEPALIVE", "20")
+        ),
+        keepalive_expiry=30,
+    )
+
+
+def get_cache_ttl() -> Optional[float]:
+    """
+    Get the TTL override for cached API responses.
+
+    Returns:
+        float, optional: The TTL in seconds from HYPERFUNNEL_CACHE_TTL (0 disables
+             caching), or None to use each tool's default TTL.
+    """
+    ttl = os.getenv("HYPERFUNNEL_CACHE_TTL")
+    return float(ttl) if ttl else None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the HTTP client shared by all tools.
+
+    The client is created on first use and reused afterwards, so tool calls
+    share a keep-alive connection pool instead of opening a new connection
+    for every request. HTTP/2 is enabled so concurrent calls can be
+    multiplexed over one connection when the API supports it.
+
+    Returns:
+        httpx.AsyncClient: The process-wide HTTP client.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=get_http_limits(),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if it has been created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@asynccontextmanager
+async def http_client_lifespan(server) -> AsyncIterator[None]:
+    """
+    MCP server lifespan that closes the shared HTTP client on shutdown.
+
+    FastMCP enters the lifespan once per session, so the client is only
+    closed when the last active session ends.
+    """
+    global _http_client_users
+    _http_client_users += 1
+    try:
+        yield
+    finally:
+        _http_client_users -= 1
+        if _http_client_users == 0:
+            await close_http_client()
@@ -7,12 +7,10 @@ using the class-based approach with dependency injection.
 
 import argparse
 import sys
-from fastmcp import FastMCP
-from tools.hotels import HotelTools
-from tools.destinations import DestinationTools
-from tools.rooms import RoomTools
-from tools.availability import AvailabilityTools
-from tools.bookings import BookingTools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 
 def parse_arguments():
@@ -54,18 +52,68 @@ Examples:
     return parser.parse_args()
 
 
-# Initialize the MCP server
-mcp = FastMCP("HyperFunnel Destinations MCP Server")
+def build_server() -> "FastMCP":
+    """
+    Create the MCP server and register all tools.
+
+    FastMCP and the tool modules are imported here rather than at module level
+    so that argument parsing (including --help) does not pay their import cost.
+    """
+    from fastmcp import FastMCP
+    from config import http_client_lifespan
+    from tools._util import serialize_result
+    from tools.hotels import HotelTools
+    from tools.destinations import DestinationTools
+    from tools.rooms import RoomTools
+    from tools.availability import AvailabilityTools
+    from tools.bookings import BookingTools
+
+    # Initialize the MCP server; the lifespan closes the shared HTTP client on shutdown
+    # and tool results are serialized with orjson
+    mcp = FastMCP(
+        "HyperFunnel Destinations MCP Server",
+        lifespan=http_client_lifespan,
+        tool_serializer=serialize_result,
+    )
+
+    # Initialize tool classes - they auto-register when instantiated
+    for tool_class in (
+        HotelTools,
+        DestinationTools,
+        RoomTools,
+        AvailabilityTools,
+        BookingTools,
+    ):
+        tool_class(mcp)
+
+    return mcp
+
+
+def __getattr__(name: str):
+    """
+    Build the server on first access to the module-level `mcp`.
+
+    Entry points that import this module, such as `fastmcp run`, `fastmcp dev`
+    and `fastmcp inspect`, look the server up as `my_server.mcp`.
+    """
+    if name == "mcp":
+        global mcp
+        mcp = build_server()
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Initialize tool classes - they auto-register when instantiated
-HotelTools(mcp)
-DestinationTools(mcp)
-RoomTools(mcp)
-AvailabilityTools(mcp)
-BookingTools(mcp)
 
 if __name__ == "__main__":
     args = parse_arguments()
+    mcp = build_server()
+
+    # Run the event loop on uvloop when it is installed
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
 
     print(
         f"🚀 Starting HyperFunnel MCP Server with {args.transport.upper()} transport..."
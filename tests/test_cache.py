@@ -0,0 +1,187 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+import config
+from tools._cache import ResponseCache
+
+
+class ResponseCacheTests(unittest.IsolatedAsyncioTestCase):
+    """ResponseCache against a mock API that records every request it receives."""
+
+    def setUp(self):
+        self.requests = []
+        self.responses = {}
+        self.delay = 0
+        config._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler)
+        )
+        self.now = 1000.0
+        # Replace the cache's clock only, the event loop keeps the real one
+        patcher = mock.patch("tools._cache.time")
+        patcher.start().monotonic.side_effect = lambda: self.now
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await config.close_http_client()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        status, headers = self.responses.get(request.url.path, (200, {}))
+        if status == 304:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(status, json={"path": request.url.path}, headers=headers)
+
+    async def test_fresh_hit_is_served_from_cache(self):
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        first = await cache.get("http://api/a")
+        second = await cache.get("http://api/a")
+        self.assertIs(first, second)
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_params_are_part_of_the_key(self):
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a", params={"city": "Paris"})
+        await cache.get("http://api/a", params={"city": "Rome"})
+        await cache.get("http://api/a", params={"city": "Paris"})
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_expired_entry_is_fetched_again(self):
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a")
+        self.now += 61
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_max_age_overrides_default_ttl(self):
+        self.responses["/a"] = (200, {"cache-control": "max-age=5"})
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a")
+        self.now += 6
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_error_responses_are_not_cached(self):
+        self.responses["/a"] = (404, {})
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a")
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_no_store_is_never_cached(self):
+        self.responses["/a"] = (200, {"cache-control": "no-store", "etag": '"v1"'})
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a")
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 2)
+        self.assertNotIn("if-none-match", self.requests[1].headers)
+
+    async def test_no_cache_without_validators_is_not_cached(self):
+        self.responses["/a"] = (200, {"cache-control": "no-cache"})
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a")
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 2)
+        self.assertNotIn("if-none-match", self.requests[1].headers)
+
+    async def test_no_cache_with_validators_is_revalidated(self):
+        self.responses["/a"] = (200, {"cache-control": "no-cache", "etag": '"v1"'})
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a")
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1].headers["if-none-match"], '"v1"')
+
+    async def test_304_returns_the_cached_response(self):
+        self.responses["/a"] = (
+            200,
+            {"etag": '"v1"', "last-modified": "Mon, 05 Jan 2026 00:00:00 GMT"},
+        )
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        first = await cache.get("http://api/a")
+        self.now += 61
+        self.responses["/a"] = (304, {})
+        second = await cache.get("http://api/a")
+        self.assertIs(second, first)
+        self.assertEqual(second.status_code, 200)
+        headers = self.requests[1].headers
+        self.assertEqual(headers["if-none-match"], '"v1"')
+        self.assertEqual(headers["if-modified-since"], "Mon, 05 Jan 2026 00:00:00 GMT")
+
+    async def test_bare_304_keeps_the_cached_cache_control(self):
+        self.responses["/a"] = (200, {"etag": '"v1"', "cache-control": "max-age=0"})
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a")
+        self.responses["/a"] = (304, {})
+        for _ in range(3):
+            self.assertEqual((await cache.get("http://api/a")).status_code, 200)
+        self.assertEqual(len(self.requests), 4)
+
+    async def test_304_cache_control_replaces_the_cached_one(self):
+        self.responses["/a"] = (200, {"etag": '"v1"', "cache-control": "max-age=0"})
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        await cache.get("http://api/a")
+        self.responses["/a"] = (304, {"cache-control": "max-age=30"})
+        await cache.get("http://api/a")
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_304_shared_by_caller_without_a_cached_entry(self):
+        self.responses["/a"] = (200, {"etag": '"v1"', "cache-control": "max-age=0"})
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        first = await cache.get("http://api/a")
+        self.responses["/a"] = (304, {})
+        self.delay = 0.05
+        revalidating = asyncio.create_task(cache.get("http://api/a"))
+        await asyncio.sleep(0.01)
+        cache.clear()
+        joined = await cache.get("http://api/a")
+        self.assertIs(await revalidating, first)
+        self.assertIs(joined, first)
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_lru_entry_is_evicted_past_maxsize(self):
+        cache = ResponseCache(ttl_seconds=60, maxsize=2)
+        await cache.get("http://api/a")
+        await cache.get("http://api/b")
+        await cache.get("http://api/a")
+        await cache.get("http://api/c")
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 3)
+        await cache.get("http://api/b")
+        self.assertEqual(len(self.requests), 4)
+
+    async def test_304_after_eviction_respects_maxsize(self):
+        self.responses["/a"] = (200, {"etag": '"v1"', "cache-control": "max-age=0"})
+        cache = ResponseCache(ttl_seconds=60, maxsize=1)
+        await cache.get("http://api/a")
+        self.responses["/a"] = (304, {})
+        self.delay = 0.05
+        revalidating = asyncio.create_task(cache.get("http://api/a"))
+        await asyncio.sleep(0.01)
+        self.delay = 0
+        await cache.get("http://api/b")
+        await revalidating
+        self.assertEqual(len(cache._entries), 1)
+
+    async def test_zero_ttl_disables_caching(self):
+        self.responses["/a"] = (200, {"etag": '"v1"'})
+        cache = ResponseCache(ttl_seconds=0, maxsize=8)
+        await cache.get("http://api/a")
+        await cache.get("http://api/a")
+        self.assertEqual(len(self.requests), 2)
+        self.assertNotIn("if-none-match", self.requests[1].headers)
+
+    async def test_concurrent_misses_share_one_request(self):
+        self.delay = 0.01
+        cache = ResponseCache(ttl_seconds=60, maxsize=8)
+        responses = await asyncio.gather(*(cache.get("http://api/a") for _ in range(5)))
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(all(response is responses[0] for response in responses))
+
+
+if __name__ == "__main__":
+    unittest.main()
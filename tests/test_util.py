@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+
+from tools._util import SingleFlight
+
+
+class SingleFlightTests(unittest.IsolatedAsyncioTestCase):
+    """SingleFlight coalescing of concurrent calls sharing a key."""
+
+    def setUp(self):
+        self.calls = 0
+
+    async def call(self, result="ok", delay=0.01, error=None):
+        self.calls += 1
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+
+    async def test_concurrent_calls_share_one_result(self):
+        flight = SingleFlight()
+        results = await asyncio.gather(
+            *(flight.do("key", lambda: self.call(object())) for _ in range(5))
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+        results = await asyncio.gather(
+            flight.do("a", lambda: self.call("a")),
+            flight.do("b", lambda: self.call("b")),
+        )
+        self.assertEqual(results, ["a", "b"])
+        self.assertEqual(self.calls, 2)
+
+    async def test_key_is_released_once_the_call_completes(self):
+        flight = SingleFlight()
+        await flight.do("key", self.call)
+        await flight.do("key", self.call)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(flight._inflight, {})
+
+    async def test_exception_reaches_every_caller(self):
+        flight = SingleFlight()
+        results = await asyncio.gather(
+            *(
+                flight.do("key", lambda: self.call(error=RuntimeError("boom")))
+                for _ in range(3)
+            ),
+            return_exceptions=True,
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(flight._inflight, {})
+
+    async def test_cancelled_caller_does_not_cancel_the_shared_call(self):
+        flight = SingleFlight()
+        first = asyncio.create_task(flight.do("key", lambda: self.call(delay=0.05)))
+        second = asyncio.create_task(flight.do("key", lambda: self.call(delay=0.05)))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        self.assertEqual(await second, "ok")
+        self.assertTrue(first.cancelled())
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
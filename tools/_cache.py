@@ -0,0 +1,125 @@
+"""
+In-process caching for read-only API requests.
+
+This module contains a small TTL cache for GET responses, used by tools
+whose data changes rarely and which agents tend to call repeatedly.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import httpx
+from config import get_cache_ttl, get_http_client
+from tools._util import SingleFlight, request_key
+
+
+class ResponseCache:
+    """TTL-bounded cache of successful GET responses, keyed by URL and query params."""
+
+    def __init__(self, ttl_seconds: float, maxsize: int):
+        # HYPERFUNNEL_CACHE_TTL overrides the per-cache default; 0 disables caching
+        override = get_cache_ttl()
+        self.ttl_seconds = ttl_seconds if override is None else override
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._inflight = SingleFlight()
+
+    async def get(self, url: str, params: Optional[dict] = None) -> httpx.Response:
+        """
+        Perform a GET request, returning a cached response if one is still fresh.
+
+        Only successful (2xx) responses are cached, for the max-age the API sends
+        in Cache-Control or else the cache's TTL. Stale responses that carry an
+        ETag or Last-Modified are revalidated with a conditional request, and
+        reused as-is when the API answers 304 Not Modified. Concurrent misses for
+        the same request share a single API call.
+
+        Args:
+            url (str): The URL to request.
+            params (dict, optional): Query parameters for the request.
+
+        Returns:
+            httpx.Response: The cached or freshly fetched response.
+        """
+        key = request_key(url, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if entry[0] > time.monotonic():
+                return entry[1]
+
+        return await self._inflight.do(
+            key, lambda: self._fetch(key, url, params, entry)
+        )
+
+    async def _fetch(
+        self, key: tuple, url: str, params: Optional[dict], entry: Optional[tuple]
+    ) -> httpx.Response:
+        """
+        Fetch a response, or revalidate a stale entry, and update the cache.
+
+        Runs once per in-flight request, so a 304 Not Modified is resolved to the
+        cached response for every caller sharing the call.
+        """
+        # Revalidate a stale entry instead of downloading it again
+        headers = self._validators(entry[1]) if entry is not None else None
+        response = await get_http_client().get(url, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            # A 304 updates the stored response's headers, so keep its
+            # Cache-Control unless the 304 carries a new one
+            cached = entry[1]
+            ttl = self._response_ttl(
+                response if "cache-control" in response.headers else cached
+            )
+            self._store(key, ttl, cached)
+            return cached
+
+        if self.ttl_seconds <= 0:
+            return response
+        ttl = self._response_ttl(response) if response.is_success else None
+        self._store(key, ttl, response)
+        return response
+
+    def _store(
+        self, key: tuple, ttl: Optional[float], response: httpx.Response
+    ) -> None:
+        """Cache a response for ttl seconds, or drop the key if it must not be cached."""
+        if ttl is not None and (ttl > 0 or self._validators(response)):
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.pop(key, None)
+
+    def _response_ttl(self, response: httpx.Response) -> Optional[float]:
+        """
+        Pick the TTL for a response from its Cache-Control header.
+
+        Returns None for no-store responses, which must not be cached at all, and
+        0 for no-cache ones, which are only kept if they can be revalidated.
+        """
+        for directive in response.headers.get("cache-control", "").split(","):
+            name, _, value = directive.strip().lower().partition("=")
+            if name == "no-store":
+                return None
+            if name == "no-cache":
+                return 0
+            if name == "max-age" and value.isdigit():
+                return float(value)
+        return self.ttl_seconds
+
+    @staticmethod
+    def _validators(response: httpx.Response) -> Optional[dict]:
+        """Build conditional request headers from a cached response's validators."""
+        headers = {}
+        if "etag" in response.headers:
+            headers["If-None-Match"] = response.headers["etag"]
+        if "last-modified" in response.headers:
+            headers["If-Modified-Since"] = response.headers["last-modified"]
+        return headers or None
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
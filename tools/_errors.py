@@ -0,0 +1,89 @@
+"""
+Error handling for the HyperFunnel MCP tools.
+
+This module contains the decorator that turns exceptions raised while
+calling the API into structured error results, so that tool bodies only
+need to handle the successful path.
+"""
+
+import functools
+import inspect
+import httpx
+import orjson
+from typing import Awaitable, Callable
+from config import DEBUG_RESPONSES
+from tools._util import (
+    CONNECT_ERR,
+    INVALID_ARGS_ERR,
+    UNEXPECTED_ERR,
+    InvalidArgumentError,
+    debug_fields,
+)
+
+
+def mcp_tool_errors(
+    url: str,
+) -> Callable[[Callable[..., Awaitable[dict]]], Callable[..., Awaitable[dict]]]:
+    """
+    Decorate a tool method to return an error result instead of raising.
+
+    Malformed arguments (InvalidArgumentError from the validate_* helpers)
+    return INVALID_ARGS_ERR, connection failures CONNECT_ERR and any other
+    exception an "Unexpected error" result, all with the tool's endpoint URL.
+
+    Args:
+        url (str): Name of the instance attribute holding the tool's endpoint URL,
+            as a template formatted with the tool's arguments (e.g. "{hotel_id}").
+
+    Returns:
+        Callable: A decorator wrapping the tool coroutine function, keeping its
+            signature.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[dict]]) -> Callable[..., Awaitable[dict]]:
+        signature = inspect.signature(fn)
+
+        def endpoint_url(args: tuple, kwargs: dict) -> str:
+            arguments = signature.bind(*args, **kwargs).arguments
+            return getattr(arguments["self"], url).format_map(arguments)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> dict:
+            try:
+                return await fn(*args, **kwargs)
+            except InvalidArgumentError as e:
+                return {
+                    "error": str(e),
+                    **INVALID_ARGS_ERR,
+                    "url": endpoint_url(args, kwargs),
+                }
+            except httpx.ConnectError as e:
+                return {
+                    **CONNECT_ERR,
+                    "url": endpoint_url(args, kwargs),
+                    **_request_debug_fields(e),
+                }
+            except Exception as e:
+                return {
+                    "error": f"Unexpected error: {e}",
+                    **UNEXPECTED_ERR,
+                    "url": endpoint_url(args, kwargs),
+                    **_request_debug_fields(e),
+                }
+
+        return wrapper
+
+    return decorator
+
+
+def _request_debug_fields(exc: Exception) -> dict:
+    """Build the debugging fields (request_body) of a failed request."""
+    if not DEBUG_RESPONSES:
+        return {}
+    try:
+        request = exc.request
+    except (AttributeError, RuntimeError):
+        return {}
+    if not request.content:
+        return {}
+    return debug_fields(request_body=orjson.loads(request.content))
@@ -0,0 +1,246 @@
+"""
+Shared helpers for the HyperFunnel MCP tools.
+
+This module contains small utilities used by several tool modules,
+such as request encoding, response parsing, request coalescing and
+canned error results.
+"""
+
+import asyncio
+import httpx
+import orjson
+import uuid
+from datetime import date
+from typing import Awaitable, Callable, Hashable, Iterable, Optional
+from config import DEBUG_RESPONSES, get_api_base_url
+
+# Headers for request bodies pre-serialized with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Error results built once and merged with per-call context (url, ...)
+CONNECT_ERR = {
+    "error": f"Could not connect to {get_api_base_url()}. Make sure the API is running.",
+    "status_code": None,
+    "success": False,
+}
+UNEXPECTED_ERR = {"status_code": None, "success": False}
+INVALID_ARGS_ERR = {"status_code": 400, "success": False}
+
+# Maximum number of concurrent API requests issued by a single batch tool
+BATCH_CONCURRENCY = 20
+# Maximum number of items a single batch tool call may request
+MAX_BATCH_SIZE = 50
+
+
+def parse_response(response: httpx.Response):
+    """
+    Parse an API response body.
+
+    JSON responses (by Content-Type) are decoded with orjson; anything else,
+    or a body that fails to decode, is returned as text. Server errors (5xx)
+    are returned as text without attempting to decode them.
+
+    Args:
+        response (httpx.Response): The response returned by the API.
+
+    Returns:
+        The decoded JSON content, or the response text.
+    """
+    if response.status_code >= 500:
+        return response.text
+    content_type = response.headers.get("content-type", "")
+    if "json" in content_type:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return response.text
+    return response.text
+
+
+def serialize_result(result) -> str:
+    """
+    Serialize a tool result to the JSON text sent to MCP clients.
+
+    Used as the FastMCP tool_serializer: orjson produces the same compact JSON
+    as FastMCP's default serializer, several times faster on large results.
+    """
+    return orjson.dumps(result, default=str).decode()
+
+
+class InvalidArgumentError(ValueError):
+    """Raised by the validate_* helpers when a tool argument is malformed."""
+
+
+def validate_dates(check_in_date: str, check_out_date: str) -> int:
+    """
+    Check that a date range is well formed before sending it to the API.
+
+    Args:
+        check_in_date (str): The start date in YYYY-MM-DD format.
+        check_out_date (str): The end date in YYYY-MM-DD format.
+
+    Returns:
+        int: The number of nights between the two dates.
+
+    Raises:
+        InvalidArgumentError: If a date is malformed or check_out_date is not
+            after check_in_date.
+    """
+    try:
+        check_in = date.fromisoformat(check_in_date)
+        check_out = date.fromisoformat(check_out_date)
+    except ValueError:
+        raise InvalidArgumentError("Dates must be in YYYY-MM-DD format") from None
+    if check_out <= check_in:
+        raise InvalidArgumentError("check_out_date must be after check_in_date")
+    return (check_out - check_in).days
+
+
+def validate_positive(name: str, value: int) -> None:
+    """
+    Check that a count argument (guests, rooms) is at least 1.
+
+    Raises:
+        InvalidArgumentError: If the value is lower than 1.
+    """
+    if value < 1:
+        raise InvalidArgumentError(f"{name} must be at least 1")
+
+
+def validate_uuid(value: str) -> None:
+    """
+    Check that an identifier (hotel_id) is a well-formed UUID.
+
+    Raises:
+        InvalidArgumentError: If the value is not a valid UUID.
+    """
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        raise InvalidArgumentError("Invalid UUID format") from None
+
+
+def validate_batch(name: str, items: list) -> None:
+    """
+    Check that a batch argument (hotel_ids) holds between 1 and MAX_BATCH_SIZE items.
+
+    Raises:
+        InvalidArgumentError: If the list is empty or longer than MAX_BATCH_SIZE.
+    """
+    if not items:
+        raise InvalidArgumentError(f"{name} must not be empty")
+    if len(items) > MAX_BATCH_SIZE:
+        raise InvalidArgumentError(f"{name} must have at most {MAX_BATCH_SIZE} items")
+
+
+def request_key(url: str, params: Optional[dict] = None) -> tuple:
+    """Build a hashable key identifying a GET request by URL and query params."""
+    return (url, tuple(sorted(params.items())) if params else ())
+
+
+class SingleFlight:
+    """Coalesces concurrent identical requests into a single in-flight call."""
+
+    def __init__(self):
+        self._inflight: dict = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]):
+        """
+        Run fn() for key, or wait for the call already in flight for the same key.
+
+        The call runs as its own task, so a cancelled caller does not cancel it
+        for the other callers waiting on the same key.
+
+        Args:
+            key (Hashable): Identifies identical calls, e.g. from request_key().
+            fn (Callable): Starts the call when no identical call is in flight.
+
+        Returns:
+            The result of the shared call.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+
+async def gather_limited(
+    fn: Callable[..., Awaitable], items: Iterable, limit: int = BATCH_CONCURRENCY
+) -> list:
+    """
+    Call fn(item) for every item concurrently, with at most `limit` calls in flight.
+
+    Args:
+        fn (Callable): The coroutine function to call for each item.
+        items (Iterable): The arguments to call fn with.
+        limit (int, optional): Maximum number of concurrent calls.
+
+    Returns:
+        list: The results, in the same order as items.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(item):
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+async def gather_batch(
+    fn: Callable[..., Awaitable[dict]], name: str, items: list
+) -> dict:
+    """
+    Run a single-item tool for every distinct item of a batch tool argument.
+
+    Args:
+        fn (Callable): The single-item tool method, e.g. get_hotel_by_id.
+        name (str): The name of the batch argument, used in error messages.
+        items (list): The batch argument, e.g. a list of hotel IDs.
+
+    Returns:
+        dict: A "results" mapping of each item to its fn result and "success" set
+            when every call succeeded, or an INVALID_ARGS_ERR result when the
+            batch is empty or longer than MAX_BATCH_SIZE.
+    """
+    items = list(dict.fromkeys(items))
+
+    # Bound the fan-out of a single call
+    try:
+        validate_batch(name, items)
+    except InvalidArgumentError as e:
+        return {"error": str(e), **INVALID_ARGS_ERR}
+
+    results = await gather_limited(fn, items)
+    return {
+        "success": all(result["success"] for result in results),
+        "results": dict(zip(items, results)),
+    }
+
+
+def debug_fields(
+    response: Optional[httpx.Response] = None, request_body: Optional[dict] = None
+) -> dict:
+    """
+    Build the debugging fields of a tool result.
+
+    Response headers and the request body are only echoed back when
+    HYPERFUNNEL_DEBUG=1, to keep regular tool results small.
+
+    Args:
+        response (httpx.Response, optional): The response whose headers to include.
+        request_body (dict, optional): The request body that was sent.
+
+    Returns:
+        dict: The debugging fields, or an empty dict when debugging is disabled.
+    """
+    if not DEBUG_RESPONSES:
+        return {}
+    fields = {}
+    if response is not None:
+        fields["headers"] = dict(response.headers)
+    if request_body is not None:
+        fields["request_body"] = request_body
+    return fields
@@ -5,26 +5,45 @@ This module contains all tools related to room availability operations including
 searching for available rooms by various criteria and date ranges.
 """
 
-import httpx
+import orjson
 from typing import Optional
 from fastmcp import FastMCP
-from config import get_api_base_url
+from config import get_api_base_url, get_http_client
+from tools._errors import mcp_tool_errors
+from tools._util import (
+    JSON_HEADERS,
+    SingleFlight,
+    debug_fields,
+    parse_response,
+    request_key,
+    validate_dates,
+    validate_positive,
+)
 
 
 class AvailabilityTools:
     """Availability-related tools using class-based approach with dependency injection."""
 
+    # Names of the methods registered as MCP tools
+    _TOOL_FNS = ("search_availability", "get_room_calendar")
+
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
         self.base_url = get_api_base_url()
+        # Precompute endpoint URLs once instead of on every call
+        self.search_url = f"{self.base_url}/availability/search"
+        self.calendar_tpl = self.base_url + "/availability/room/{room_id}/calendar"
+        # Identical calendar requests in flight at the same time share one API call
+        self.calendar_flight = SingleFlight()
         # Auto-register all tools when class is instantiated
         self._register_tools()
 
     def _register_tools(self):
         """Automatically register all tool methods."""
-        self.mcp.tool()(self.search_availability)
-        self.mcp.tool()(self.get_room_calendar)
+        for name in self._TOOL_FNS:
+            self.mcp.tool()(getattr(self, name))
 
+    @mcp_tool_errors("search_url")
     async def search_availability(
         self,
         check_in_date: str,
@@ -52,58 +71,42 @@ class AvailabilityTools:
             dict: A dictionary of available rooms that match the search criteria.
         """
 
-        url = f"{self.base_url}/availability/search"
+        url = self.search_url
+
+        # Reject malformed input locally instead of paying for an API round-trip
+        validate_dates(check_in_date, check_out_date)
+        validate_positive("guests", guests)
+        validate_positive("min_rooms", min_rooms)
 
-        # Build the request body following the AvailabilitySearch schema
+        # Build the request body following the AvailabilitySearch schema,
+        # leaving out optional IDs that were not provided or are empty
         request_body = {
             "check_in_date": check_in_date,
             "check_out_date": check_out_date,
             "guests": guests,
             "min_rooms": min_rooms,
+            **{
+                key: value
+                for key, value in (("hotel_id", hotel_id), ("room_id", room_id))
+                if value
+            },
         }
 
-        # Add optional parameters only if provided
-        if hotel_id:
-            request_body["hotel_id"] = hotel_id
-        if room_id:
-            request_body["room_id"] = room_id
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=request_body)
-
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                    "url": url,
-                    "request_body": request_body,  # Include request body for debugging
-                }
-
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to 127.0.0.1:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-                "url": url,
-                "request_body": request_body,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-                "url": url,
-                "request_body": request_body,
-            }
+        response = await get_http_client().post(
+            url, content=orjson.dumps(request_body), headers=JSON_HEADERS
+        )
+
+        content = parse_response(response)
+
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            "url": url,
+            **debug_fields(response, request_body),
+        }
 
+    @mcp_tool_errors("calendar_tpl")
     async def get_room_calendar(
         self,
         room_id: str,
@@ -123,7 +126,10 @@ class AvailabilityTools:
         Returns:
             dict: A dictionary showing the room's availability for each day in the date range.
         """
-        url = f"{self.base_url}/availability/room/{room_id}/calendar"
+        url = self.calendar_tpl.format(room_id=room_id)
+
+        # Reject malformed input locally instead of paying for an API round-trip
+        validate_dates(check_in_date, check_out_date)
 
         # Build query parameters
         params = {
@@ -131,35 +137,17 @@ class AvailabilityTools:
             "check_out_date": check_out_date,
         }
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params)
-
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                    "url": str(response.url),  # Include the final URL with parameters
-                }
-
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to 127.0.0.1:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-                "url": url,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-                "url": url,
-            }
+        response = await self.calendar_flight.do(
+            request_key(url, params),
+            lambda: get_http_client().get(url, params=params),
+        )
+
+        content = parse_response(response)
+
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            "url": url,
+            **debug_fields(response),
+        }
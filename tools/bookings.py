@@ -5,26 +5,41 @@ This module contains all tools related to booking operations including
 getting quotes and creating reservations.
 """
 
-import httpx
+import orjson
 from typing import Optional
 from fastmcp import FastMCP
-from config import get_api_base_url
+from config import get_api_base_url, get_http_client
+from tools._errors import mcp_tool_errors
+from tools._util import (
+    JSON_HEADERS,
+    debug_fields,
+    parse_response,
+    validate_dates,
+    validate_positive,
+)
 
 
 class BookingTools:
     """Booking-related tools using class-based approach with dependency injection."""
 
+    # Names of the methods registered as MCP tools
+    _TOOL_FNS = ("get_booking_quote", "create_booking")
+
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
         self.base_url = get_api_base_url()
+        # Precompute endpoint URLs once instead of on every call
+        self.quote_url = f"{self.base_url}/bookings/quote"
+        self.bookings_url = f"{self.base_url}/bookings"
         # Auto-register all tools when class is instantiated
         self._register_tools()
 
     def _register_tools(self):
         """Automatically register all tool methods."""
-        self.mcp.tool()(self.get_booking_quote)
-        self.mcp.tool()(self.create_booking)
+        for name in self._TOOL_FNS:
+            self.mcp.tool()(getattr(self, name))
 
+    @mcp_tool_errors("quote_url")
     async def get_booking_quote(
         self,
         room_id: str,
@@ -45,9 +60,14 @@ class BookingTools:
             guests (int): The number of guests for the booking.
 
         Returns:
-            dict: A dictionary with the total price and details for the booking quote.
+            dict: A dictionary with the total price and details for the booking quote,
+                plus the number of nights in the stay.
         """
-        url = f"{self.base_url}/bookings/quote"
+        url = self.quote_url
+
+        # Reject malformed input locally instead of paying for an API round-trip
+        nights = validate_dates(check_in_date, check_out_date)
+        validate_positive("guests", guests)
 
         # Build the request body following the BookingQuoteRequest schema
         request_body = {
@@ -57,42 +77,22 @@ class BookingTools:
             "guests": guests,
         }
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=request_body)
-
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                    "url": url,
-                    "request_body": request_body,
-                }
-
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to 127.0.0.1:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-                "url": url,
-                "request_body": request_body,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-                "url": url,
-                "request_body": request_body,
-            }
+        response = await get_http_client().post(
+            url, content=orjson.dumps(request_body), headers=JSON_HEADERS
+        )
 
+        content = parse_response(response)
+
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            "url": url,
+            "nights": nights,
+            **debug_fields(response, request_body),
+        }
+
+    @mcp_tool_errors("bookings_url")
     async def create_booking(
         self,
         hotel_id: str,
@@ -118,52 +118,37 @@ class BookingTools:
         Returns:
             dict: A dictionary confirming the successful creation of the booking.
         """
-        url = f"{self.base_url}/bookings"
+        url = self.bookings_url
+
+        # Reject malformed input locally instead of paying for an API round-trip
+        validate_dates(check_in_date, check_out_date)
+        validate_positive("guests", guests)
 
-        # Build the request body following the BookingCreate schema
+        # Build the request body following the BookingCreate schema,
+        # leaving out the status if it was not provided
         request_body = {
-            "hotel_id": hotel_id,
-            "room_id": room_id,
-            "check_in_date": check_in_date,
-            "check_out_date": check_out_date,
-            "guests": guests,
+            key: value
+            for key, value in (
+                ("hotel_id", hotel_id),
+                ("room_id", room_id),
+                ("check_in_date", check_in_date),
+                ("check_out_date", check_out_date),
+                ("guests", guests),
+                ("status", status),
+            )
+            if value is not None
         }
 
-        if status is not None:
-            request_body["status"] = status
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=request_body)
-
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                    "url": url,
-                    "request_body": request_body,
-                }
-
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to 127.0.0.1:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-                "url": url,
-                "request_body": request_body,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-                "url": url,
-                "request_body": request_body,
-            }
+        response = await get_http_client().post(
+            url, content=orjson.dumps(request_body), headers=JSON_HEADERS
+        )
+
+        content = parse_response(response)
+
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            "url": url,
+            **debug_fields(response, request_body),
+        }
@@ -4,24 +4,35 @@ Destination-related tools for the HyperFunnel MCP Server.
 This module contains all tools related to destination operations.
 """
 
-import httpx
 from fastmcp import FastMCP
 from config import get_api_base_url
+from tools._cache import ResponseCache
+from tools._errors import mcp_tool_errors
+from tools._util import debug_fields, parse_response
 
 
 class DestinationTools:
     """Destination-related tools using class-based approach with dependency injection."""
 
+    # Names of the methods registered as MCP tools
+    _TOOL_FNS = ("get_available_destinations",)
+
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
         self.base_url = get_api_base_url()
+        # Precompute endpoint URLs once instead of on every call
+        self.destinations_url = f"{self.base_url}/destinations"
+        # The destination catalog changes rarely, so cache it briefly
+        self.destinations_cache = ResponseCache(ttl_seconds=60, maxsize=1)
         # Auto-register all tools when class is instantiated
         self._register_tools()
 
     def _register_tools(self):
         """Automatically register all tool methods."""
-        self.mcp.tool()(self.get_available_destinations)
+        for name in self._TOOL_FNS:
+            self.mcp.tool()(getattr(self, name))
 
+    @mcp_tool_errors("destinations_url")
     async def get_available_destinations(self) -> dict:
         """
         Retrieves information on available travel destinations from the HyperFunnel service.
@@ -32,34 +43,15 @@ class DestinationTools:
         Returns:
              dict: The complete API response, including destination data.
         """
-        url = f"{self.base_url}/destinations"
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
+        url = self.destinations_url
 
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
+        response = await self.destinations_cache.get(url)
 
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                }
+        content = parse_response(response)
 
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to localhost:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-            }
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            **debug_fields(response),
+        }
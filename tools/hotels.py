@@ -5,27 +5,51 @@ This module contains all tools related to hotel operations including
 getting hotel lists, individual hotel details, and hotel room information.
 """
 
-import httpx
 from typing import Optional
 from fastmcp import FastMCP
 from config import get_api_base_url
+from tools._cache import ResponseCache
+from tools._errors import mcp_tool_errors
+from tools._util import (
+    debug_fields,
+    gather_batch,
+    parse_response,
+    validate_uuid,
+)
 
 
 class HotelTools:
     """Hotel-related tools using class-based approach with dependency injection."""
 
+    # Names of the methods registered as MCP tools
+    _TOOL_FNS = (
+        "search_hotels",
+        "get_hotel_by_id",
+        "get_hotels_by_ids",
+        "get_hotel_details_with_rooms",
+        "get_hotels_details_with_rooms",
+    )
+
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
         self.base_url = get_api_base_url()
+        # Precompute endpoint URLs once instead of on every call
+        self.hotels_url = f"{self.base_url}/hotels"
+        self.hotel_tpl = self.hotels_url + "/{hotel_id}"
+        self.hotel_rooms_tpl = self.hotels_url + "/{hotel_id}/with-rooms"
+        # Hotel searches are repeated often while exploring, so cache them briefly
+        self.search_cache = ResponseCache(ttl_seconds=30, maxsize=64)
+        # Individual hotel lookups, with or without rooms
+        self.hotel_cache = ResponseCache(ttl_seconds=60, maxsize=512)
         # Auto-register all tools when class is instantiated
         self._register_tools()
 
     def _register_tools(self):
         """Automatically register all tool methods."""
-        self.mcp.tool()(self.search_hotels)
-        self.mcp.tool()(self.get_hotel_by_id)
-        self.mcp.tool()(self.get_hotel_details_with_rooms)
+        for name in self._TOOL_FNS:
+            self.mcp.tool()(getattr(self, name))
 
+    @mcp_tool_errors("hotels_url")
     async def search_hotels(
         self, country: Optional[str] = None, city: Optional[str] = None
     ) -> dict:
@@ -43,51 +67,31 @@ class HotelTools:
         Returns:
             dict: A dictionary containing the data of the hotels found.
         """
-        base_url = f"{self.base_url}/hotels"
-
-        # Build query parameters
-        params = {}
-        if city:
-            params["city"] = city
-        elif country:
-            params["country"] = country
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(base_url, params=params)
-
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                    "url": str(response.url),  # Include the final URL with parameters
-                }
-
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to 127.0.0.1:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-            }
+        url = self.hotels_url
+
+        # Build query parameters; city takes precedence over country
+        params = {"city": city} if city else {"country": country} if country else {}
+
+        response = await self.search_cache.get(url, params=params)
+
+        content = parse_response(response)
 
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            "url": url,
+            **debug_fields(response),
+        }
+
+    @mcp_tool_errors("hotel_tpl")
     async def get_hotel_by_id(self, hotel_id: str) -> dict:
         """
         Retrieves a specific hotel's details using its unique identifier.
 
         This tool is best used when the user is asking for information about a single, known hotel.
+        If the hotel's rooms are needed as well, use get_hotel_details_with_rooms instead,
+        which returns both in a single request.
 
         Args:
             hotel_id (str): The unique identifier of the hotel.
@@ -95,41 +99,40 @@ class HotelTools:
         Returns:
             dict: A dictionary with the complete hotel's details.
         """
-        url = f"{self.base_url}/hotels/{hotel_id}"
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                    "url": url,
-                }
-
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to 127.0.0.1:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-                "url": url,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-                "url": url,
-            }
+        url = self.hotel_tpl.format(hotel_id=hotel_id)
+
+        # Reject malformed input locally instead of paying for an API round-trip
+        validate_uuid(hotel_id)
+
+        response = await self.hotel_cache.get(url)
+
+        content = parse_response(response)
 
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            "url": url,
+            **debug_fields(response),
+        }
+
+    async def get_hotels_by_ids(self, hotel_ids: list[str]) -> dict:
+        """
+        Retrieves the details of several hotels at once using their unique identifiers.
+
+        Use this tool instead of calling get_hotel_by_id repeatedly when information
+        about a list of known hotels is needed; the hotels are fetched in parallel.
+
+        Args:
+            hotel_ids (list[str]): The unique identifiers of the hotels (at most 50).
+
+        Returns:
+            dict: A dictionary with a "results" mapping of each hotel ID to its
+                get_hotel_by_id result, and "success" set when every lookup succeeded.
+        """
+        return await gather_batch(self.get_hotel_by_id, "hotel_ids", hotel_ids)
+
+    @mcp_tool_errors("hotel_rooms_tpl")
     async def get_hotel_details_with_rooms(self, hotel_id: str) -> dict:
         """
         Retrieves complete details for a specific hotel, including information for all of its rooms.
@@ -143,37 +146,38 @@ class HotelTools:
         Returns:
             dict: A dictionary containing the hotel's details and a list of its rooms.
         """
-        url = f"{self.base_url}/hotels/{hotel_id}/with-rooms"
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                    "url": url,
-                }
-
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to 127.0.0.1:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-                "url": url,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-                "url": url,
-            }
+        url = self.hotel_rooms_tpl.format(hotel_id=hotel_id)
+
+        # Reject malformed input locally instead of paying for an API round-trip
+        validate_uuid(hotel_id)
+
+        response = await self.hotel_cache.get(url)
+
+        content = parse_response(response)
+
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            "url": url,
+            **debug_fields(response),
+        }
+
+    async def get_hotels_details_with_rooms(self, hotel_ids: list[str]) -> dict:
+        """
+        Retrieves complete details, including all rooms, for several hotels at once.
+
+        Use this tool instead of calling get_hotel_details_with_rooms repeatedly when
+        comparing a list of known hotels; the hotels are fetched in parallel.
+
+        Args:
+            hotel_ids (list[str]): The unique identifiers of the hotels (at most 50).
+
+        Returns:
+            dict: A dictionary with a "results" mapping of each hotel ID to its
+                get_hotel_details_with_rooms result, and "success" set when every
+                lookup succeeded.
+        """
+        return await gather_batch(
+            self.get_hotel_details_with_rooms, "hotel_ids", hotel_ids
+        )
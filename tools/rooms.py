@@ -1,21 +1,37 @@
-import httpx
 from fastmcp import FastMCP
 from config import get_api_base_url
+from tools._cache import ResponseCache
+from tools._errors import mcp_tool_errors
+from tools._util import (
+    debug_fields,
+    gather_batch,
+    parse_response,
+    validate_uuid,
+)
 
 
 class RoomTools:
     """Room-related tools using class-based approach with dependency injection."""
 
+    # Names of the methods registered as MCP tools
+    _TOOL_FNS = ("get_rooms_by_hotel_id", "get_rooms_by_hotel_ids")
+
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
         self.base_url = get_api_base_url()
+        # Precompute endpoint URLs once instead of on every call
+        self.rooms_by_hotel_tpl = self.base_url + "/rooms/by-hotel/{hotel_id}"
+        # Room inventories are read repeatedly while exploring, so cache them briefly
+        self.rooms_cache = ResponseCache(ttl_seconds=60, maxsize=512)
         # Auto-register all tools when class is instantiated
         self._register_tools()
 
     def _register_tools(self):
         """Automatically register all tool methods."""
-        self.mcp.tool()(self.get_rooms_by_hotel_id)
+        for name in self._TOOL_FNS:
+            self.mcp.tool()(getattr(self, name))
 
+    @mcp_tool_errors("rooms_by_hotel_tpl")
     async def get_rooms_by_hotel_id(self, hotel_id: str) -> dict:
         """
         Retrieves all rooms available for a specific hotel from the HyperFunnel API.
@@ -25,6 +41,9 @@ class RoomTools:
         The tool provides detailed information about all rooms including types, availability,
         pricing, and amenities for the specified hotel.
 
+        If the hotel's own details are needed as well, use get_hotel_details_with_rooms
+        instead, which returns the hotel and its rooms in a single request.
+
         Typical use cases:
         - Get all available rooms for a specific hotel
         - Display room inventory for booking purposes
@@ -42,7 +61,7 @@ class RoomTools:
         Returns:
             dict: Complete API response that includes:
                 - status_code (int): HTTP status code (200, 400, 404, 500, etc.)
-                - headers (dict): Response headers from the server
+                - headers (dict, optional): Response headers, only when HYPERFUNNEL_DEBUG=1
                 - content (dict|str): Response content (array of Room objects or error)
                 - success (bool): True if the response was successful (2xx)
                 - error (str, optional): Error message if any problem occurred
@@ -55,37 +74,36 @@ class RoomTools:
 
         Note: Requires the service to be running on localhost:8000
         """
-        url = f"{self.base_url}/rooms/by-hotel/{hotel_id}"
-
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-
-                # Try to parse as JSON, fallback to text if it fails
-                try:
-                    content = response.json()
-                except:
-                    content = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "content": content,
-                    "success": response.is_success,
-                    "url": url,
-                }
-
-        except httpx.ConnectError:
-            return {
-                "error": "Could not connect to 127.0.0.1:8000. Make sure the API is running.",
-                "status_code": None,
-                "success": False,
-                "url": url,
-            }
-        except Exception as e:
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "status_code": None,
-                "success": False,
-                "url": url,
-            }
+        url = self.rooms_by_hotel_tpl.format(hotel_id=hotel_id)
+
+        # Reject malformed input locally instead of paying for an API round-trip
+        validate_uuid(hotel_id)
+
+        response = await self.rooms_cache.get(url)
+
+        content = parse_response(response)
+
+        return {
+            "status_code": response.status_code,
+            "content": content,
+            "success": response.is_success,
+            "url": url,
+            **debug_fields(response),
+        }
+
+    async def get_rooms_by_hotel_ids(self, hotel_ids: list[str]) -> dict:
+        """
+        Retrieves all rooms for several hotels at once from the HyperFunnel API.
+
+        Use this tool instead of calling get_rooms_by_hotel_id repeatedly when room
+        inventories for a list of hotels are needed; the hotels are fetched in parallel.
+
+        Args:
+            hotel_ids (list[str]): The unique UUID identifiers of the hotels to get rooms for
+                (at most 50)
+
+        Returns:
+            dict: A dictionary with a "results" mapping of each hotel ID to its
+                get_rooms_by_hotel_id result, and "success" set when every lookup succeeded.
+        """
+        return await gather_batch(self.get_rooms_by_hotel_id, "hotel_ids", hotel_ids)